@@ -15,15 +15,21 @@
 # limitations under the License.
 
 import asyncio
+import functools
+import io
 import json
 import os
+import threading
+import time
 from contextlib import contextmanager
-from typing import Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Set, Tuple
 
 import boto3
 import botocore.exceptions
 import cloudpickle as pickle
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 from boto3.session import Session
+from botocore.config import Config
 from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
 from covalent_aws_plugins import AWSExecutor
@@ -41,12 +47,98 @@ _EXECUTOR_PLUGIN_DEFAULTS = {
     "s3_bucket_name": "covalent-lambda-job-resources",
     "poll_freq": 5,
     "timeout": 900,
+    "async_invoke": True,
+    "keep_warm": False,
+    "warm_interval": 300,
 }
 
 FUNC_FILENAME = "func-{dispatch_id}-{node_id}.pkl"
 RESULT_FILENAME = "result-{dispatch_id}-{node_id}.pkl"
 EXCEPTION_FILENAME = "exception-{dispatch_id}-{node_id}.json"
 
+# Pickle protocol used for objects exchanged with the lambda function (see exec.py)
+PICKLE_PROTOCOL = 5
+
+# Initial delay between polls for the task result, doubled every poll up to `poll_freq`
+MIN_POLL_INTERVAL = 0.1
+
+# Shared by all clients: bounded timeouts, retries with backoff for throttled/transient
+# errors, and a connection pool large enough for the tasks running concurrently
+BOTO_CLIENT_CONFIG = Config(
+    connect_timeout=5,
+    read_timeout=60,
+    retries={"max_attempts": 5, "mode": "standard"},
+    max_pool_connections=32,
+)
+
+# Slack in seconds given to a synchronous invocation on top of the executor's `timeout`
+SYNC_INVOKE_READ_TIMEOUT_MARGIN = 10
+
+# Multipart transfers with larger chunks and parts moved concurrently for S3 uploads/downloads
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=10,
+    io_chunksize=1024 * 1024,
+    use_threads=True,
+)
+
+# Error codes AWS returns once the credentials a cached client was created with have been
+# rotated or have expired, e.g. temporary credentials from SSO, aws-vault or saml2aws
+EXPIRED_CREDENTIALS_ERRORS = frozenset(
+    {
+        "ExpiredToken",
+        "ExpiredTokenException",
+        "InvalidAccessKeyId",
+        "InvalidClientTokenId",
+        "UnrecognizedClientException",
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def sync_invoke_client_config(timeout: float) -> Config:
+    """Client config for synchronous invocations waiting at most `timeout` seconds
+
+    Synchronous invocations block until the function returns and must not be retried since
+    a retry would run the task a second time. The read timeout follows the executor's
+    `timeout`, so a thread that `run` stopped waiting on is released shortly after. Configs
+    are cached as they are part of the client cache key.
+
+    Args:
+        timeout: Time in seconds to wait for the function to return
+
+    Returns:
+        config: botocore client config shared by all executors with the same timeout
+    """
+    return BOTO_CLIENT_CONFIG.merge(
+        Config(
+            read_timeout=timeout + SYNC_INVOKE_READ_TIMEOUT_MARGIN,
+            retries={"total_max_attempts": 1, "mode": "standard"},
+        )
+    )
+
+
+# boto3 clients are thread-safe and expensive to construct, so they are shared
+# across executor instances keyed on the service name and session options
+_boto_clients: Dict[Tuple, Any] = {}
+_boto_clients_lock = threading.Lock()
+
+# Buckets for which a 403 on HEAD has already been reported, see `get_status_sync`
+_forbidden_buckets: Set[str] = set()
+
+# Inert payload used to keep the lambda container warm between tasks (see exec.py)
+WARM_PAYLOAD = json.dumps({"__warm__": True})
+
+# Keep-warm pings stop once no task has run for this many `warm_interval`s
+KEEP_WARM_IDLE_PINGS = 6
+
+# Pending keep-warm timers and the time of the last task run, one per lambda function
+# and session options
+_warmers: Dict[Tuple, threading.Timer] = {}
+_last_runs: Dict[Tuple, float] = {}
+_warmers_lock = threading.Lock()
+
 
 class AWSLambdaExecutor(AWSExecutor):
     """AWS Lambda executor plugin
@@ -57,8 +149,11 @@ class AWSLambdaExecutor(AWSExecutor):
         credentials_file: Path to AWS credentials file (default: `~/.aws/credentials`)
         profile: AWS profile (default: `default`)
         region: AWS region (default: `us-east-1`)
-        poll_freq: Time interval between successive polls to the lambda function (default: `5`)
-        timeout: Duration in seconds to poll Lambda function for results (default: `900`)
+        poll_freq: Maximum time interval between successive polls to the lambda function (default: `5`)
+        timeout: Duration in seconds to poll Lambda function for results, or to wait for it to return when invoked synchronously (default: `900`)
+        async_invoke: Invoke the lambda function asynchronously and poll S3 for the result, otherwise wait for the function to return (default: `True`)
+        keep_warm: Periodically ping the lambda function to avoid cold starts between tasks, pings stop once no task has run for `KEEP_WARM_IDLE_PINGS` intervals (default: `False`)
+        warm_interval: Time interval in seconds between successive keep-warm pings (default: `300`)
     """
 
     def __init__(
@@ -70,6 +165,9 @@ class AWSLambdaExecutor(AWSExecutor):
         region: str = None,
         poll_freq: int = None,
         timeout: int = 900,
+        async_invoke: bool = None,
+        keep_warm: bool = None,
+        warm_interval: int = None,
     ) -> None:
         # AWSExecutor parameters
         required_attrs = {
@@ -90,6 +188,15 @@ class AWSLambdaExecutor(AWSExecutor):
         )
         self.poll_freq = poll_freq or get_config("executors.awslambda.poll_freq")
         self.timeout = timeout or get_config("executors.awslambda.timeout")
+        self.async_invoke = (
+            async_invoke
+            if async_invoke is not None
+            else get_config("executors.awslambda.async_invoke")
+        )
+        self.keep_warm = (
+            keep_warm if keep_warm is not None else get_config("executors.awslambda.keep_warm")
+        )
+        self.warm_interval = warm_interval or get_config("executors.awslambda.warm_interval")
 
     @contextmanager
     def get_session(self) -> Session:
@@ -103,12 +210,66 @@ class AWSLambdaExecutor(AWSExecutor):
         """
         yield boto3.Session(**self.boto_session_options())
 
-    def _upload_task_sync(self, workdir: str, func_filename: str):
+    def _client(self, service_name: str, config: Config = BOTO_CLIENT_CONFIG) -> Any:
+        """Return a cached boto3 client for the given AWS service
+
+        Args:
+            service_name: Name of the AWS service, e.g. `s3` or `lambda`
+            config: botocore client config, one of the module-level configs
+
+        Returns:
+            client: boto3 client shared by all executors with the same profile, region and credentials
         """
-        Upload the function file to remote
+        key = (service_name, self.profile, self.region, self.credentials_file, config)
+        with _boto_clients_lock:
+            if key not in _boto_clients:
+                with self.get_session() as session:
+                    _boto_clients[key] = session.client(service_name, config=config)
+            return _boto_clients[key]
+
+    def _evict_expired_clients(self, error: Exception) -> None:
+        """Drop the cached clients of this executor's session if AWS rejected its credentials
+
+        Clients resolve credentials once, so without this rotated or expired credentials
+        would keep failing until the dispatcher is restarted. The failing call still raises,
+        the next one creates new clients with fresh credentials.
+
+        Args:
+            error: Exception raised by a boto3 client call
+
+        Returns:
+            None
+        """
+        if not isinstance(error, botocore.exceptions.ClientError):
+            return
+        if error.response.get("Error", {}).get("Code") not in EXPIRED_CREDENTIALS_ERRORS:
+            return
+
+        app_log.warning("AWS credentials were rejected, dropping cached boto3 clients")
+        session_key = (self.profile, self.region, self.credentials_file)
+        with _boto_clients_lock:
+            for key in [key for key in _boto_clients if key[1:4] == session_key]:
+                del _boto_clients[key]
+
+    def _transfer_manager(self) -> Any:
+        """Return the S3 transfer manager shared by all executors with the same session options
+
+        Sharing one manager lets concurrent tasks reuse its worker threads instead of every
+        upload starting and stopping its own pool.
+        """
+        s3_client = self._client("s3")
+        key = ("s3transfer", self.profile, self.region, self.credentials_file, TRANSFER_CONFIG)
+        with _boto_clients_lock:
+            if key not in _boto_clients:
+                _boto_clients[key] = create_transfer_manager(s3_client, TRANSFER_CONFIG)
+            return _boto_clients[key]
+
+    def _upload_task_sync(self, func_buffer: io.BytesIO, func_filename: str):
+        """
+        Upload the pickled function to remote
 
         Args:
-            workdir: Work dir on remote to upload file to
+            func_buffer: In-memory buffer holding the pickled function, args and kwargs
             func_filename: Name of the function file
 
         Returns:
@@ -116,20 +277,19 @@ class AWSLambdaExecutor(AWSExecutor):
         """
 
         app_log.debug(f"Uploading function to S3 bucket {self.s3_bucket_name}")
-        with self.get_session() as session:
-            client = session.client("s3")
-            try:
-                with open(os.path.join(workdir, func_filename), "rb") as f:
-                    client.upload_fileobj(f, self.s3_bucket_name, func_filename)
-            except botocore.exceptions.ClientError as ce:
-                app_log.exception(ce)
-                raise
+        transfer_manager = self._transfer_manager()
+        try:
+            transfer_manager.upload(func_buffer, self.s3_bucket_name, func_filename).result()
+        except botocore.exceptions.ClientError as ce:
+            self._evict_expired_clients(ce)
+            app_log.exception(ce)
+            raise
         app_log.debug(f"Function {func_filename} uploaded to S3 bucket {self.s3_bucket_name}")
 
-    async def _upload_task(self, workdir: str, func_filename: str):
+    async def _upload_task(self, func_buffer: io.BytesIO, func_filename: str):
         """Method to upload task."""
         loop = asyncio.get_running_loop()
-        fut = loop.run_in_executor(None, self._upload_task_sync, workdir, func_filename)
+        fut = loop.run_in_executor(None, self._upload_task_sync, func_buffer, func_filename)
         await fut
 
     def submit_task_sync(
@@ -138,24 +298,75 @@ class AWSLambdaExecutor(AWSExecutor):
         """The actual (blocking) submit_task function"""
         app_log.debug(f"Invoking AWS Lambda function {function_name}")
 
-        with self.get_session() as session:
-            client = session.client("lambda")
-            try:
-                return client.invoke(
-                    FunctionName=function_name,
-                    Payload=json.dumps(
-                        {
-                            "S3_BUCKET_NAME": self.s3_bucket_name,
-                            "COVALENT_TASK_FUNC_FILENAME": func_filename,
-                            "RESULT_FILENAME": result_filename,
-                            "EXCEPTION_FILENAME": exception_filename,
-                        }
-                    ),
-                    InvocationType="Event",
+        if self.async_invoke:
+            client = self._client("lambda")
+        else:
+            client = self._client("lambda", sync_invoke_client_config(self.timeout))
+        try:
+            return client.invoke(
+                FunctionName=function_name,
+                Payload=json.dumps(
+                    {
+                        "S3_BUCKET_NAME": self.s3_bucket_name,
+                        "COVALENT_TASK_FUNC_FILENAME": func_filename,
+                        "RESULT_FILENAME": result_filename,
+                        "EXCEPTION_FILENAME": exception_filename,
+                    }
+                ),
+                InvocationType="Event" if self.async_invoke else "RequestResponse",
+            )
+        except botocore.exceptions.ClientError as ce:
+            self._evict_expired_clients(ce)
+            app_log.exception(ce)
+            raise
+
+    def _ping_lambda(self, key: Tuple) -> None:
+        """Invoke the lambda function with an inert payload and schedule the next ping"""
+        with _warmers_lock:
+            if time.monotonic() - _last_runs[key] > self.warm_interval * KEEP_WARM_IDLE_PINGS:
+                # No task has run for a while, let the container go cold
+                app_log.debug(
+                    f"Stopping keep-warm pings to AWS Lambda function {self.function_name}"
                 )
-            except botocore.exceptions.ClientError as ce:
-                app_log.exception(ce)
-                raise
+                del _warmers[key]
+                del _last_runs[key]
+                return
+
+        app_log.debug(f"Sending keep-warm ping to AWS Lambda function {self.function_name}")
+        try:
+            self._client("lambda").invoke(
+                FunctionName=self.function_name, InvocationType="Event", Payload=WARM_PAYLOAD
+            )
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            # A failed ping only costs a cold start, keep pinging
+            self._evict_expired_clients(e)
+            app_log.exception(e)
+        finally:
+            with _warmers_lock:
+                # The finished timer is dropped even if the next one fails to start, so
+                # the next task run restarts the pings
+                if _warmers.pop(key, None) is not None:
+                    self._schedule_ping(key)
+
+    def _schedule_ping(self, key: Tuple) -> None:
+        """Schedule a keep-warm ping in `warm_interval` seconds, must hold `_warmers_lock`"""
+        timer = threading.Timer(self.warm_interval, self._ping_lambda, args=(key,))
+        # Do not keep the dispatcher process alive just to ping the lambda
+        timer.daemon = True
+        timer.start()
+        _warmers[key] = timer
+
+    def _start_keep_warm(self) -> None:
+        """Record a task run and start pinging the lambda function unless already pinging
+
+        The pings outlive the executor instance, covalent creates one per task, and stop
+        once no task has run on the function for `KEEP_WARM_IDLE_PINGS` intervals.
+        """
+        key = (self.function_name, self.profile, self.region, self.credentials_file)
+        with _warmers_lock:
+            _last_runs[key] = time.monotonic()
+            if key not in _warmers:
+                self._schedule_ping(key)
 
     async def submit_task(
         self, function_name: str, func_filename: str, result_filename: str, exception_filename: str
@@ -181,13 +392,31 @@ class AWSLambdaExecutor(AWSExecutor):
         return await fut
 
     def get_status_sync(self, object_key: str) -> bool:
-        with self.get_session() as session:
-            s3_client = session.client("s3")
-            try:
-                s3_client.head_object(Bucket=self.s3_bucket_name, Key=object_key)
-            except botocore.exceptions.ClientError:
+        """Check whether an object exists in the S3 bucket with a single HEAD request
+
+        A 403 is treated like a 404, i.e. the object is not there yet: without the
+        s3:ListBucket permission S3 reports missing keys as 403. A real permission error
+        therefore shows up as a timeout, a warning is logged the first time it is seen.
+        """
+        s3_client = self._client("s3")
+        try:
+            s3_client.head_object(Bucket=self.s3_bucket_name, Key=object_key)
+        except botocore.exceptions.ClientError as ce:
+            # HEAD responses have no body, the error code is the bare HTTP status
+            code = ce.response.get("Error", {}).get("Code")
+            if code == "403" and self.s3_bucket_name not in _forbidden_buckets:
+                _forbidden_buckets.add(self.s3_bucket_name)
+                app_log.warning(
+                    f"Access to {object_key} in S3 bucket {self.s3_bucket_name} is forbidden, "
+                    "treating it as not yet uploaded. Grant s3:ListBucket on the bucket to "
+                    "tell missing objects apart from permission errors."
+                )
+            if code in ("403", "404"):
                 return False
-            return True
+            self._evict_expired_clients(ce)
+            app_log.exception(ce)
+            raise
+        return True
 
     async def get_status(self, object_key: str):
         """
@@ -208,19 +437,30 @@ class AWSLambdaExecutor(AWSExecutor):
         """
         Poll task until its result is ready
 
+        The delay between polls starts at `MIN_POLL_INTERVAL` and doubles after every
+        unsuccessful poll until it reaches `poll_freq`, so short tasks are picked up quickly
+        while long running tasks are not polled more often than configured.
+
         Args:
-            object_key: Name of the object to check if present in S3
+            object_keys: Names of the objects to check if present in S3
         """
         time_left = self.timeout
+        delay = min(MIN_POLL_INTERVAL, self.poll_freq)
 
-        while time_left > 0:
+        while True:
             for object_key in object_keys:
                 app_log.debug(f"Polling object: {object_key}")
                 status = await self.get_status(object_key)
                 if status:
                     return object_key
-                await asyncio.sleep(self.poll_freq)
-            time_left -= self.poll_freq
+
+            if time_left <= 0:
+                break
+
+            delay = min(delay, time_left)
+            await asyncio.sleep(delay)
+            time_left -= delay
+            delay = min(delay * 2, self.poll_freq)
 
         raise TimeoutError(f"{object_keys} not found in {self.s3_bucket_name}")
 
@@ -234,18 +474,19 @@ class AWSLambdaExecutor(AWSExecutor):
         Returns:
             None
         """
-        with self.get_session() as session:
-            s3_client = session.client("s3")
-            # Download file
-            try:
-                s3_client.download_file(
-                    self.s3_bucket_name,
-                    exception_filename,
-                    os.path.join(workdir, exception_filename),
-                )
-            except botocore.exceptions.ClientError as ce:
-                app_log.exception(ce)
-                raise
+        s3_client = self._client("s3")
+        # Download file
+        try:
+            s3_client.download_file(
+                self.s3_bucket_name,
+                exception_filename,
+                os.path.join(workdir, exception_filename),
+                Config=TRANSFER_CONFIG,
+            )
+        except botocore.exceptions.ClientError as ce:
+            self._evict_expired_clients(ce)
+            app_log.exception(ce)
+            raise
 
         with open(os.path.join(workdir, exception_filename), "r") as f:
             task_exception = json.load(f)
@@ -259,55 +500,49 @@ class AWSLambdaExecutor(AWSExecutor):
         )
         return await fut
 
-    def query_result_sync(self, workdir: str, result_filename: str):
+    def query_result_sync(self, result_filename: str):
         """
         Fetch the result object from the S3 bucket
 
+        The pickled object is streamed from the response body straight into the
+        unpickler without being written to the local file system.
+
         Args:
-            workdir: Path on the local file system where the pickled object is downloaded
+            result_filename: Name of the S3 object holding the pickled result
 
         Returns:
-            None
+            result_object: Unpickled result of the task
         """
-        with self.get_session() as session:
-            s3_client = session.client("s3")
-            # Download file
-            try:
-                s3_client.download_file(
-                    self.s3_bucket_name,
-                    result_filename,
-                    os.path.join(workdir, result_filename),
-                )
-            except botocore.exceptions.ClientError as ce:
-                app_log.exception(ce)
-                raise
+        s3_client = self._client("s3")
+        try:
+            response = s3_client.get_object(Bucket=self.s3_bucket_name, Key=result_filename)
+        except botocore.exceptions.ClientError as ce:
+            self._evict_expired_clients(ce)
+            app_log.exception(ce)
+            raise
 
-        with open(os.path.join(workdir, result_filename), "rb") as f:
-            result_object = pickle.load(f)
+        with response["Body"] as body:
+            result_object = pickle.load(body)
 
         return result_object
 
-    async def query_result(self, workdir: str, result_filename: str):
+    async def query_result(self, result_filename: str):
         loop = asyncio.get_running_loop()
-        fut = loop.run_in_executor(None, self.query_result_sync, workdir, result_filename)
+        fut = loop.run_in_executor(None, self.query_result_sync, result_filename)
         return await fut
 
-    def _pickle_func_sync(
-        self, function: Callable, workdir: str, func_filename: str, args: List, kwargs: Dict
-    ):
-        """Method to pickle function synchronously."""
+    def _pickle_func_sync(self, function: Callable, args: List, kwargs: Dict) -> io.BytesIO:
+        """Method to pickle function synchronously into an in-memory buffer."""
         app_log.debug("Pickling function, args and kwargs..")
-        with open(os.path.join(workdir, func_filename), "wb") as f:
-            pickle.dump((function, args, kwargs), f)
+        func_buffer = io.BytesIO()
+        pickle.dump((function, args, kwargs), func_buffer, protocol=PICKLE_PROTOCOL)
+        func_buffer.seek(0)
+        return func_buffer
 
-    async def _pickle_func(
-        self, function: Callable, workdir: str, func_filename: str, args: List, kwargs: Dict
-    ):
+    async def _pickle_func(self, function: Callable, args: List, kwargs: Dict) -> io.BytesIO:
         """Pickle function asynchronously."""
         loop = asyncio.get_running_loop()
-        fut = loop.run_in_executor(
-            None, self._pickle_func_sync, function, workdir, func_filename, args, kwargs
-        )
+        fut = loop.run_in_executor(None, self._pickle_func_sync, function, args, kwargs)
         return await fut
 
     async def run(self, function: Callable, args: List, kwargs: Dict, task_metadata: Dict):
@@ -332,24 +567,48 @@ class AWSLambdaExecutor(AWSExecutor):
         app_log.debug(f"In run for task - {dispatch_id} - {node_id} ... ")
 
         # Pickle function asynchronously
-        await self._pickle_func(function, workdir, func_filename, args, kwargs)
+        func_buffer = await self._pickle_func(function, args, kwargs)
 
-        # Upload pickled file to s3 bucket created
-        await self._upload_task(workdir, func_filename)
+        # Upload pickled function to s3 bucket created
+        await self._upload_task(func_buffer, func_filename)
 
         # Invoke the created lambda
-        lambda_invocation_response = await self.submit_task(
+        submit = self.submit_task(
             self.function_name, func_filename, result_filename, exception_filename
         )
+        if self.async_invoke:
+            lambda_invocation_response = await submit
+        else:
+            # The function keeps running if we stop waiting, as it would when polling times out
+            try:
+                lambda_invocation_response = await asyncio.wait_for(submit, self.timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"AWS Lambda function {self.function_name} did not return within "
+                    f"{self.timeout} seconds"
+                ) from None
         app_log.debug(f"Lambda function response: {lambda_invocation_response}")
+        if self.keep_warm:
+            self._start_keep_warm()
         if "FunctionError" in lambda_invocation_response:
             error = lambda_invocation_response["Payload"].read().decode("utf-8")
             raise RuntimeError(
                 f"Exception occurred while running task {dispatch_id}:{node_id}: {error}"
             )
 
-        # Poll task
-        object_key = await self._poll_task([result_filename, exception_filename])
+        if self.async_invoke:
+            # Poll task
+            object_key = await self._poll_task([result_filename, exception_filename])
+        else:
+            # The function has returned, its response names the object it uploaded
+            payload = json.loads(lambda_invocation_response["Payload"].read())
+            object_key = payload.get("object_key") if isinstance(payload, dict) else None
+            if object_key not in (result_filename, exception_filename):
+                raise RuntimeError(
+                    f"AWS Lambda function {self.function_name} returned {payload!r} instead of "
+                    "the key of the uploaded result, its image predates synchronous "
+                    "invocations. Rebuild or update the lambda image, or use async_invoke=True"
+                )
 
         if object_key == exception_filename:
             # Download the raised exception
@@ -363,10 +622,57 @@ class AWSLambdaExecutor(AWSExecutor):
         if object_key == result_filename:
             # Download the result object
             app_log.debug(f"Retrieving result for task - {dispatch_id} - {node_id}")
-            result_object = await self.query_result(workdir, result_filename)
+            result_object = await self.query_result(result_filename)
             app_log.debug(f"Result retrived for task - {dispatch_id} - {node_id}")
             return result_object
 
+    def _teardown_sync(self, object_keys: List[str]) -> None:
+        """
+        Delete the task's objects from the S3 bucket in a single request
+
+        Args:
+            object_keys: Names of the S3 objects to delete
+
+        Returns:
+            None
+        """
+        s3_client = self._client("s3")
+        try:
+            response = s3_client.delete_objects(
+                Bucket=self.s3_bucket_name,
+                Delete={"Objects": [{"Key": key} for key in object_keys], "Quiet": True},
+            )
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            # Failing to clean up must not fail an otherwise successful task
+            self._evict_expired_clients(e)
+            app_log.exception(e)
+            return
+
+        for error in response.get("Errors", []):
+            app_log.warning(f"Failed to delete {error.get('Key')}: {error.get('Message')}")
+
+    async def teardown(self, task_metadata: Dict):
+        """Remove the task's function, result and exception objects from the S3 bucket
+
+        Args:
+            task_metadata: Dictionary containing the task dispatch_id and node_id
+
+        Returns:
+            None
+        """
+        dispatch_id = task_metadata["dispatch_id"]
+        node_id = task_metadata["node_id"]
+        object_keys = [
+            FUNC_FILENAME.format(dispatch_id=dispatch_id, node_id=node_id),
+            RESULT_FILENAME.format(dispatch_id=dispatch_id, node_id=node_id),
+            EXCEPTION_FILENAME.format(dispatch_id=dispatch_id, node_id=node_id),
+        ]
+        app_log.debug(f"Removing task objects from S3 bucket {self.s3_bucket_name}")
+
+        loop = asyncio.get_running_loop()
+        fut = loop.run_in_executor(None, self._teardown_sync, object_keys)
+        await fut
+
     def cancel(self) -> None:
         """
         Cancel execution
@@ -16,14 +16,43 @@
 
 """Handler for AWS Lambda executor."""
 
+import io
 import json
 import os
+from functools import lru_cache
 
 import boto3
 import cloudpickle as pickle
+from boto3.s3.transfer import TransferConfig
+
+# Pickle protocol used for objects exchanged with the executor (see awslambda.py)
+PICKLE_PROTOCOL = 5
+
+# Buffer size for reading the function pickle from /tmp, large enough for multi-MB
+# objects to be read without hundreds of small read syscalls
+FILE_BUFFER_SIZE = 1 << 20
+
+# Multipart transfers with larger chunks and parts moved concurrently (see awslambda.py)
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=10,
+    io_chunksize=1024 * 1024,
+    use_threads=True,
+)
+
+
+@lru_cache(maxsize=None)
+def _s3_client():
+    """Create the S3 client once and reuse it while the lambda container stays warm"""
+    return boto3.client("s3")
 
 
 def handler(event, context):
+    # Keep-warm ping from the executor, nothing to run
+    if event.get("__warm__"):
+        return
+
     try:
         os.environ["HOME"] = "/tmp"
         os.chdir("/tmp")
@@ -33,24 +62,36 @@ def handler(event, context):
         result_filename = event["RESULT_FILENAME"]
         exception_filename = event["EXCEPTION_FILENAME"]
 
-        local_func_filename = os.path.join("/tmp", func_filename)
-        local_result_filename = os.path.join("/tmp", result_filename)
-        local_exception_filename = os.path.join("/tmp", exception_filename)
+        local_func_filename = f"/tmp/{func_filename}"
+        local_exception_filename = f"/tmp/{exception_filename}"
 
-        s3 = boto3.client("s3")
-        s3.download_file(s3_bucket, func_filename, local_func_filename)
+        s3 = _s3_client()
+        s3.download_file(s3_bucket, func_filename, local_func_filename, Config=TRANSFER_CONFIG)
 
-        with open(local_func_filename, "rb") as f:
+        with open(local_func_filename, "rb", buffering=FILE_BUFFER_SIZE) as f:
             function, args, kwargs = pickle.load(f)
 
         result = function(*args, **kwargs)
-        with open(local_result_filename, "wb") as f:
-            pickle.dump(result, f)
-
-        s3.upload_file(local_result_filename, s3_bucket, result_filename)
+        # The serialized result is held in memory next to the result itself, in exchange
+        # for skipping the round trip through /tmp
+        payload = pickle.dumps(result, protocol=PICKLE_PROTOCOL)
+        if len(payload) < TRANSFER_CONFIG.multipart_threshold:
+            s3.put_object(Bucket=s3_bucket, Key=result_filename, Body=payload)
+        else:
+            # Large results are uploaded in concurrent parts, a single PUT is capped at 5 GB
+            s3.upload_fileobj(
+                io.BytesIO(payload), s3_bucket, result_filename, Config=TRANSFER_CONFIG
+            )
+        object_key = result_filename
     except Exception as ex:
         # Write json and upload to S3
         with open(local_exception_filename, "w") as f:
             json.dump(str(ex), f)
 
-        s3.upload_file(local_exception_filename, s3_bucket, exception_filename)
+        s3.upload_file(
+            local_exception_filename, s3_bucket, exception_filename, Config=TRANSFER_CONFIG
+        )
+        object_key = exception_filename
+
+    # Returned to the executor when invoked synchronously
+    return {"object_key": object_key}
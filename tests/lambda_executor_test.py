@@ -16,15 +16,44 @@
 
 """Tests for Covalent AWSLambda executor"""
 
+import asyncio
+import io
 import json
 import os
+from types import SimpleNamespace
 
 import botocore.exceptions
 import cloudpickle as pickle
 import pytest
-from mock import AsyncMock, MagicMock
+from mock import AsyncMock, MagicMock, Mock
 
-from covalent_awslambda_plugin import AWSLambdaExecutor
+from covalent_awslambda_plugin import AWSLambdaExecutor, awslambda
+
+_CLIENT_ERROR = botocore.exceptions.ClientError(
+    {"Error": {"Code": "TestError", "Message": "test error"}}, "TestOperation"
+)
+
+_CAT_MISSING = "cat: non_existent_file.txt: No such file or directory"
+
+
+def _session_client(session_mock):
+    """Return the mocked ``session.client`` factory yielded by a patched ``get_session``"""
+    session_mock.return_value.__exit__.return_value = False
+    return session_mock.return_value.__enter__.return_value.client
+
+
+@pytest.fixture(autouse=True)
+def clear_boto_clients():
+    """Drop boto3 clients and keep-warm state left by previous tests"""
+    awslambda._boto_clients.clear()
+    awslambda._warmers.clear()
+    awslambda._last_runs.clear()
+    awslambda._forbidden_buckets.clear()
+    yield
+    awslambda._boto_clients.clear()
+    awslambda._warmers.clear()
+    awslambda._last_runs.clear()
+    awslambda._forbidden_buckets.clear()
 
 
 @pytest.fixture
@@ -36,6 +65,34 @@ def lambda_executor():
         region="us-east-1",
         s3_bucket_name="test_bucket_name",
         poll_freq=30,
+        async_invoke=True,
+        keep_warm=False,
+        warm_interval=300,
+    )
+
+
+@pytest.fixture
+def patched_awslambda(mocker):
+    """Patch the logger, file handling and unpickling used across the executor module"""
+    return SimpleNamespace(
+        app_log=mocker.patch("covalent_awslambda_plugin.awslambda.app_log"),
+        open=mocker.patch("covalent_awslambda_plugin.awslambda.open"),
+        pickle_load=mocker.patch("covalent_awslambda_plugin.awslambda.pickle.load"),
+    )
+
+
+@pytest.fixture
+def task_ids():
+    """Identifiers and S3 object keys for a single task"""
+    dispatch_id, node_id = "abcd", 0
+    return SimpleNamespace(
+        dispatch_id=dispatch_id,
+        node_id=node_id,
+        task_metadata={"dispatch_id": dispatch_id, "node_id": node_id},
+        lambda_name=f"lambda-{dispatch_id}-{node_id}",
+        func_filename=f"func-{dispatch_id}-{node_id}.pkl",
+        result_filename=f"result-{dispatch_id}-{node_id}.pkl",
+        exception_filename=f"exception-{dispatch_id}-{node_id}.json",
     )
 
 
@@ -47,6 +104,9 @@ def test_init():
         region="us-east-1",
         s3_bucket_name="test_bucket_name",
         poll_freq=30,
+        async_invoke=True,
+        keep_warm=False,
+        warm_interval=300,
     )
 
     assert awslambda.function_name == "test_function"
@@ -55,143 +115,408 @@ def test_init():
     assert awslambda.region == "us-east-1"
     assert awslambda.s3_bucket_name == "test_bucket_name"
     assert awslambda.poll_freq == 30
+    assert awslambda.async_invoke is True
+    assert awslambda.keep_warm is False
+    assert awslambda.warm_interval == 300
+
+
+def test_init_config_defaults(mocker):
+    """Test that options not passed to the constructor are read from the covalent config."""
+    config = {
+        f"executors.awslambda.{key}": value
+        for key, value in awslambda._EXECUTOR_PLUGIN_DEFAULTS.items()
+    }
+    config["executors.awslambda.keep_warm"] = True
+    config["executors.awslambda.async_invoke"] = False
+    get_config_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.get_config", side_effect=config.__getitem__
+    )
+
+    executor = AWSLambdaExecutor()
+
+    get_config_mock.assert_any_call("executors.awslambda.async_invoke")
+    get_config_mock.assert_any_call("executors.awslambda.keep_warm")
+    get_config_mock.assert_any_call("executors.awslambda.warm_interval")
+    assert executor.async_invoke is False
+    assert executor.keep_warm is True
+    assert executor.warm_interval == 300
+    assert AWSLambdaExecutor(keep_warm=False).keep_warm is False
 
 
-@pytest.mark.asyncio
-async def test_function_pickle_dump(lambda_executor, mocker):
+async def test_function_pickle_dump(lambda_executor, task_ids, mocker):
     def f(x):
         return x
 
     lambda_executor._upload_task = AsyncMock()
     lambda_executor.submit_task = AsyncMock()
     lambda_executor._poll_task = AsyncMock()
-    lambda_executor.get_session = MagicMock()
-
     lambda_executor.query_result = AsyncMock()
 
-    mocker.patch("covalent_awslambda_plugin.awslambda.os.path.join")
     file_open_mock = mocker.patch("covalent_awslambda_plugin.awslambda.open")
     pickle_dump_mock = mocker.patch("covalent_awslambda_plugin.awslambda.pickle.dump")
 
-    await lambda_executor.run(f, 1, {}, {"dispatch_id": "aabbcc", "node_id": 0})
+    await lambda_executor.run(f, 1, {}, task_ids.task_metadata)
 
-    file_open_mock.return_value.__enter__.assert_called()
+    file_open_mock.assert_not_called()
     pickle_dump_mock.assert_called_once()
+    assert pickle_dump_mock.call_args.kwargs["protocol"] == 5
 
+    func_buffer = pickle_dump_mock.call_args.args[1]
+    assert isinstance(func_buffer, io.BytesIO)
+    lambda_executor._upload_task.assert_awaited_once_with(func_buffer, task_ids.func_filename)
 
-@pytest.mark.asyncio
-async def test_upload_fileobj(lambda_executor, mocker):
+
+async def test_upload_task(lambda_executor, mocker):
     lambda_executor.get_session = MagicMock()
+    session_client_mock = _session_client(lambda_executor.get_session)
+    transfer_manager_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.create_transfer_manager"
+    )
 
     mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
-    mocker.patch("covalent_awslambda_plugin.awslambda.os.path.join")
     file_open_mock = mocker.patch("covalent_awslambda_plugin.awslambda.open")
-    mocker.patch("covalent_awslambda_plugin.awslambda.pickle.dump")
+    func_buffer = io.BytesIO(b"test")
 
-    await lambda_executor._upload_task("test_workdir", "test_func_filename")
-
-    file_open_mock.assert_called_once()
+    await lambda_executor._upload_task(func_buffer, "test_func_filename")
 
     lambda_executor.get_session.assert_called_once()
     lambda_executor.get_session.return_value.__enter__.assert_called_once()
-    lambda_executor.get_session.return_value.__enter__.return_value.client.assert_called_once_with(
-        "s3"
+    session_client_mock.assert_called_once_with("s3", config=awslambda.BOTO_CLIENT_CONFIG)
+    transfer_manager_mock.assert_called_once_with(
+        session_client_mock.return_value, awslambda.TRANSFER_CONFIG
+    )
+    file_open_mock.assert_not_called()
+    upload_mock = transfer_manager_mock.return_value.upload
+    upload_mock.assert_called_once_with(
+        func_buffer, lambda_executor.s3_bucket_name, "test_func_filename"
     )
-    file_open_mock.assert_called()
-    lambda_executor.get_session.return_value.__enter__.return_value.client.return_value.upload_fileobj.assert_called_once()
+    upload_mock.return_value.result.assert_called_once_with()
 
 
-@pytest.mark.asyncio
-async def test_upload_fileobj_sync_exception(lambda_executor, mocker):
-    def f(x):
-        return x
+def test_transfer_manager_shared(lambda_executor, mocker):
+    """Test that one transfer manager is shared by executors with the same session options."""
+    mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    transfer_manager_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.create_transfer_manager"
+    )
+    other_executor = AWSLambdaExecutor(
+        function_name="other_function",
+        credentials_file="~/.aws/credentials",
+        profile="test_profile",
+        region="us-east-1",
+        s3_bucket_name="other_bucket_name",
+        poll_freq=30,
+        async_invoke=True,
+        keep_warm=False,
+        warm_interval=300,
+    )
+
+    assert lambda_executor._transfer_manager() is other_executor._transfer_manager()
+    transfer_manager_mock.assert_called_once()
 
-    lambda_executor.get_session = MagicMock()
 
-    client_error_mock = botocore.exceptions.ClientError(MagicMock(), MagicMock())
-    lambda_executor.get_session.return_value.__enter__.return_value.client.return_value.upload_fileobj.side_effect = (
-        client_error_mock
+async def test_upload_task_sync_exception(lambda_executor, mocker):
+    lambda_executor.get_session = MagicMock()
+    _session_client(lambda_executor.get_session)
+    transfer_manager_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.create_transfer_manager"
     )
 
-    mocker.patch("covalent_awslambda_plugin.awslambda.open")
-    mocker.patch("covalent_awslambda_plugin.awslambda.pickle.dump")
+    client_error_mock = _CLIENT_ERROR
+    transfer_manager_mock.return_value.upload.return_value.result.side_effect = client_error_mock
+
     app_log_mock = mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
 
     with pytest.raises(botocore.exceptions.ClientError):
-        await lambda_executor._upload_task("test_workdir", "test_func_filename")
-        app_log_mock.exception.assert_called_with(client_error_mock)
+        await lambda_executor._upload_task(io.BytesIO(b"test"), "test_func_filename")
 
+    app_log_mock.exception.assert_called_with(client_error_mock)
 
-@pytest.mark.asyncio
-async def test_submit_task(lambda_executor, mocker):
+
+async def test_submit_task(lambda_executor, task_ids, mocker):
     session_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
         return_value=MagicMock(),
     )
-    dispatch_id = "abcd"
-    node_id = 0
-    lambda_function_name = f"lambda-{dispatch_id}-{node_id}"
-    func_filaname = "test.pkl"
-    result_filename = "result.pkl"
-    exception_filename = "exception.json"
-
     await lambda_executor.submit_task(
-        lambda_function_name, func_filaname, result_filename, exception_filename
+        task_ids.lambda_name,
+        task_ids.func_filename,
+        task_ids.result_filename,
+        task_ids.exception_filename,
     )
 
-    session_mock.return_value.__enter__.return_value.client.assert_called_with("lambda")
-    session_mock.return_value.__enter__.return_value.client.return_value.invoke.assert_called_with(
-        FunctionName=lambda_function_name,
+    session_client_mock = _session_client(session_mock)
+    session_client_mock.assert_called_with("lambda", config=awslambda.BOTO_CLIENT_CONFIG)
+    session_client_mock.return_value.invoke.assert_called_with(
+        FunctionName=task_ids.lambda_name,
         Payload=json.dumps(
             {
                 "S3_BUCKET_NAME": lambda_executor.s3_bucket_name,
-                "COVALENT_TASK_FUNC_FILENAME": "test.pkl",
-                "RESULT_FILENAME": "result.pkl",
-                "EXCEPTION_FILENAME": "exception.json",
+                "COVALENT_TASK_FUNC_FILENAME": task_ids.func_filename,
+                "RESULT_FILENAME": task_ids.result_filename,
+                "EXCEPTION_FILENAME": task_ids.exception_filename,
             }
         ),
         InvocationType="Event",
     )
 
 
-@pytest.mark.asyncio
-async def test_submit_task_exception(lambda_executor, mocker):
+async def test_submit_task_sync_invoke(lambda_executor, task_ids, mocker):
+    """Test that the lambda is invoked synchronously with a no-retry client when requested."""
     session_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
         return_value=MagicMock(),
     )
-    app_log_mock = mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
+    lambda_executor.async_invoke = False
+
+    await lambda_executor.submit_task(
+        task_ids.lambda_name,
+        task_ids.func_filename,
+        task_ids.result_filename,
+        task_ids.exception_filename,
+    )
 
-    dispatch_id = "abcd"
-    node_id = 0
-    lambda_function_name = f"lambda-{dispatch_id}-{node_id}"
-    func_filaname = "test.pkl"
-    result_filename = "result.pkl"
-    exception_filename = "exception.json"
+    session_client_mock = _session_client(session_mock)
+    config = awslambda.sync_invoke_client_config(lambda_executor.timeout)
+    session_client_mock.assert_called_once_with("lambda", config=config)
+    assert session_client_mock.return_value.invoke.call_args.kwargs["InvocationType"] == (
+        "RequestResponse"
+    )
+    assert config.retries["total_max_attempts"] == 1
+    assert config.read_timeout == (
+        lambda_executor.timeout + awslambda.SYNC_INVOKE_READ_TIMEOUT_MARGIN
+    )
 
-    client_error_mock = botocore.exceptions.ClientError(MagicMock(), MagicMock())
-    session_mock.return_value.__enter__.return_value.client.return_value.invoke.side_effect = (
-        client_error_mock
+
+async def test_submit_task_exception(lambda_executor, task_ids, mocker):
+    session_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
     )
+    app_log_mock = mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
+
+    client_error_mock = _CLIENT_ERROR
+    _session_client(session_mock).return_value.invoke.side_effect = client_error_mock
 
     with pytest.raises(botocore.exceptions.ClientError):
         await lambda_executor.submit_task(
-            lambda_function_name, func_filaname, result_filename, exception_filename
+            task_ids.lambda_name,
+            task_ids.func_filename,
+            task_ids.result_filename,
+            task_ids.exception_filename,
         )
-        app_log_mock.exception.assert_called_with(client_error_mock)
 
+    app_log_mock.exception.assert_called_with(client_error_mock)
 
-@pytest.mark.asyncio
-async def test_normal_run(lambda_executor, mocker):
-    function = None
-    args = []
-    kwargs = {}
-    dispatch_id = "asdf"
-    node_id = 0
-    task_metadata = {"dispatch_id": dispatch_id, "node_id": node_id}
 
-    open_mock = mocker.patch("covalent_awslambda_plugin.awslambda.open")
-    pickle_load_mock = mocker.patch("covalent_awslambda_plugin.awslambda.pickle.load")
+def test_keep_warm_pings_lambda(lambda_executor, mocker):
+    """Test that a single keep-warm ping is scheduled per lambda function."""
+    timer_mock = mocker.patch("covalent_awslambda_plugin.awslambda.threading.Timer")
+    key = (
+        lambda_executor.function_name,
+        lambda_executor.profile,
+        lambda_executor.region,
+        lambda_executor.credentials_file,
+    )
+
+    lambda_executor._start_keep_warm()
+    lambda_executor._start_keep_warm()
+
+    timer_mock.assert_called_once_with(300, lambda_executor._ping_lambda, args=(key,))
+    timer_mock.return_value.start.assert_called_once()
+    assert timer_mock.return_value.daemon is True
+    assert awslambda._warmers[key] is timer_mock.return_value
+    assert key in awslambda._last_runs
+
+
+def test_ping_lambda(lambda_executor, mocker):
+    """Test that a keep-warm ping invokes the lambda with an inert payload and reschedules."""
+    session_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    timer_mock = mocker.patch("covalent_awslambda_plugin.awslambda.threading.Timer")
+    awslambda._warmers["key"] = Mock()
+    awslambda._last_runs["key"] = awslambda.time.monotonic()
+
+    lambda_executor._ping_lambda("key")
+
+    _session_client(session_mock).return_value.invoke.assert_called_once_with(
+        FunctionName=lambda_executor.function_name,
+        InvocationType="Event",
+        Payload=json.dumps({"__warm__": True}),
+    )
+    timer_mock.assert_called_once_with(300, lambda_executor._ping_lambda, args=("key",))
+    timer_mock.return_value.start.assert_called_once()
+    assert awslambda._warmers["key"] is timer_mock.return_value
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        _CLIENT_ERROR,
+        botocore.exceptions.EndpointConnectionError(endpoint_url="https://lambda"),
+        RuntimeError("unexpected"),
+    ],
+)
+def test_ping_lambda_error_reschedules(lambda_executor, mocker, error):
+    """Test that a failed keep-warm ping does not end the chain of pings."""
+    session_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
+    timer_mock = mocker.patch("covalent_awslambda_plugin.awslambda.threading.Timer")
+    _session_client(session_mock).return_value.invoke.side_effect = error
+    awslambda._warmers["key"] = Mock()
+    awslambda._last_runs["key"] = awslambda.time.monotonic()
+
+    try:
+        lambda_executor._ping_lambda("key")
+    except RuntimeError:
+        # Unexpected errors still surface in the timer thread after rescheduling
+        pass
+
+    timer_mock.return_value.start.assert_called_once()
+    assert awslambda._warmers["key"] is timer_mock.return_value
+
+
+def test_ping_lambda_idle_stop(lambda_executor, mocker):
+    """Test that keep-warm pings stop once no task has run for a while."""
+    session_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    timer_mock = mocker.patch("covalent_awslambda_plugin.awslambda.threading.Timer")
+    idle = lambda_executor.warm_interval * awslambda.KEEP_WARM_IDLE_PINGS + 1
+    awslambda._warmers["key"] = Mock()
+    awslambda._last_runs["key"] = awslambda.time.monotonic() - idle
+
+    lambda_executor._ping_lambda("key")
+
+    _session_client(session_mock).return_value.invoke.assert_not_called()
+    timer_mock.assert_not_called()
+    assert "key" not in awslambda._warmers
+    assert "key" not in awslambda._last_runs
+
+
+def test_ping_lambda_timer_start_failure(lambda_executor, mocker):
+    """Test that a timer which fails to start is not left behind as an active ping."""
+    mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    timer_mock = mocker.patch("covalent_awslambda_plugin.awslambda.threading.Timer")
+    timer_mock.return_value.start.side_effect = RuntimeError("can't start new thread")
+    awslambda._warmers["key"] = Mock()
+    awslambda._last_runs["key"] = awslambda.time.monotonic()
+
+    with pytest.raises(RuntimeError):
+        lambda_executor._ping_lambda("key")
+
+    assert "key" not in awslambda._warmers
+
+
+def test_client_cache(lambda_executor, mocker):
+    """Test that boto3 clients are created once per service and reused."""
+    session_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    session_client_mock = _session_client(session_mock)
+
+    lambda_executor.get_status_sync("result.pkl")
+    lambda_executor.get_status_sync("exception.json")
+    lambda_executor.submit_task_sync("test_function", "func.pkl", "result.pkl", "exception.json")
+
+    assert session_mock.call_count == 2
+    assert session_client_mock.call_count == 2
+    assert (
+        lambda_executor._client("s3")
+        is awslambda._boto_clients[
+            ("s3", "test_profile", "us-east-1", "~/.aws/credentials", awslambda.BOTO_CLIENT_CONFIG)
+        ]
+    )
+
+    other_executor = AWSLambdaExecutor(
+        function_name="test_function",
+        credentials_file="~/.aws/credentials",
+        profile="test_profile",
+        region="us-east-1",
+        s3_bucket_name="test_bucket_name",
+        poll_freq=30,
+        async_invoke=True,
+        keep_warm=False,
+        warm_interval=300,
+    )
+    other_executor.get_status_sync("result.pkl")
+    assert session_client_mock.call_count == 2
+
+
+@pytest.mark.parametrize("code", sorted(awslambda.EXPIRED_CREDENTIALS_ERRORS))
+async def test_client_cache_evicted_on_expired_credentials(lambda_executor, mocker, code):
+    """Test that clients are recreated after AWS rejects their credentials."""
+    session_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
+    session_client_mock = _session_client(session_mock)
+    expired_error = botocore.exceptions.ClientError(
+        {"Error": {"Code": code, "Message": "expired"}}, "GetObject"
+    )
+    session_client_mock.return_value.get_object.side_effect = expired_error
+
+    other_key = ("s3", "other_profile", "us-east-1", "", awslambda.BOTO_CLIENT_CONFIG)
+    awslambda._boto_clients[other_key] = other_client = Mock()
+    lambda_executor._client("lambda")
+
+    with pytest.raises(botocore.exceptions.ClientError):
+        await lambda_executor.query_result("result.pkl")
+
+    # Only the clients of the executor's own session are dropped
+    assert awslambda._boto_clients == {other_key: other_client}
+
+    lambda_executor._client("s3")
+    assert session_client_mock.call_count == 3
+
+
+async def test_client_cache_kept_on_other_errors(lambda_executor, mocker):
+    """Test that clients are kept when a call fails for reasons other than credentials."""
+    session_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
+    session_client_mock = _session_client(session_mock)
+    session_client_mock.return_value.get_object.side_effect = _CLIENT_ERROR
+
+    with pytest.raises(botocore.exceptions.ClientError):
+        await lambda_executor.query_result("result.pkl")
+
+    lambda_executor._client("s3")
+    session_client_mock.assert_called_once()
+
+
+def test_client_config(lambda_executor, mocker):
+    """Test that boto3 clients are created with the shared client config."""
+    session_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    session_client_mock = _session_client(session_mock)
+
+    lambda_executor._client("lambda")
+
+    session_client_mock.assert_called_once_with("lambda", config=awslambda.BOTO_CLIENT_CONFIG)
+    assert awslambda.BOTO_CLIENT_CONFIG.max_pool_connections == 32
+    assert awslambda.BOTO_CLIENT_CONFIG.retries["max_attempts"] == 5
+
+
+async def test_normal_run(lambda_executor, task_ids, mocker):
     upload_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._upload_task"
     )
@@ -205,7 +530,7 @@ async def test_normal_run(lambda_executor, mocker):
 
     poll_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._poll_task",
-        return_value=f"result-{dispatch_id}-{node_id}.pkl",
+        return_value=task_ids.result_filename,
     )
     query_exception_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.query_task_exception"
@@ -213,23 +538,74 @@ async def test_normal_run(lambda_executor, mocker):
     query_result_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.query_result"
     )
-    await lambda_executor.run(function, args, kwargs, task_metadata)
+    await lambda_executor.run(None, [], {}, task_ids.task_metadata)
 
     poll_mock.assert_awaited_once()
     query_result_mock.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_exception_during_run(lambda_executor, mocker):
-    function = None
-    args = []
-    kwargs = {}
-    dispatch_id = "asdf"
-    node_id = 0
-    task_metadata = {"dispatch_id": dispatch_id, "node_id": node_id}
+async def test_sync_invoke_run(lambda_executor, task_ids, mocker):
+    """Test that a synchronous invocation reads the object key from the response instead of polling."""
+    mocker.patch("covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._upload_task")
+    payload_mock = Mock()
+    payload_mock.read.return_value = json.dumps({"object_key": task_ids.result_filename})
+    mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.submit_task",
+        return_value={"StatusCode": 200, "Payload": payload_mock},
+    )
+    poll_mock = mocker.patch("covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._poll_task")
+    query_result_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.query_result"
+    )
+    lambda_executor.async_invoke = False
 
-    open_mock = mocker.patch("covalent_awslambda_plugin.awslambda.open")
-    pickle_load_mock = mocker.patch("covalent_awslambda_plugin.awslambda.pickle.load")
+    result = await lambda_executor.run(None, [], {}, task_ids.task_metadata)
+
+    poll_mock.assert_not_awaited()
+    query_result_mock.assert_awaited_once_with(task_ids.result_filename)
+    assert result is query_result_mock.return_value
+
+
+@pytest.mark.parametrize("payload", [None, {"object_key": "other.pkl"}])
+async def test_sync_invoke_run_unexpected_payload(lambda_executor, task_ids, mocker, payload):
+    """Test that a synchronous invocation of an outdated lambda image raises a clear error."""
+    mocker.patch("covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._upload_task")
+    payload_mock = Mock()
+    payload_mock.read.return_value = json.dumps(payload)
+    mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.submit_task",
+        return_value={"StatusCode": 200, "Payload": payload_mock},
+    )
+    lambda_executor.async_invoke = False
+
+    with pytest.raises(RuntimeError, match="Rebuild or update the lambda image"):
+        await lambda_executor.run(None, [], {}, task_ids.task_metadata)
+
+
+async def test_sync_invoke_run_timeout(lambda_executor, task_ids, mocker):
+    """Test that a synchronous invocation gives up waiting after `timeout` seconds."""
+    mocker.patch("covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._upload_task")
+
+    async def slow_submit(*args):
+        await asyncio.sleep(10)
+
+    mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.submit_task",
+        side_effect=slow_submit,
+    )
+    query_result_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.query_result"
+    )
+    lambda_executor.async_invoke = False
+    lambda_executor.timeout = 0.01
+
+    with pytest.raises(TimeoutError):
+        await lambda_executor.run(None, [], {}, task_ids.task_metadata)
+
+    query_result_mock.assert_not_awaited()
+
+
+async def test_exception_during_run(lambda_executor, task_ids, mocker):
     upload_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._upload_task"
     )
@@ -243,7 +619,7 @@ async def test_exception_during_run(lambda_executor, mocker):
 
     poll_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._poll_task",
-        return_value=f"exception-{dispatch_id}-{node_id}.json",
+        return_value=task_ids.exception_filename,
     )
     query_exception_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.query_task_exception"
@@ -252,20 +628,17 @@ async def test_exception_during_run(lambda_executor, mocker):
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.query_result"
     )
     with pytest.raises(RuntimeError):
-        await lambda_executor.run(function, args, kwargs, task_metadata)
+        await lambda_executor.run(None, [], {}, task_ids.task_metadata)
 
     poll_mock.assert_awaited_once()
     query_exception_mock.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_run_error_handling(lambda_executor, mocker):
-    open_mock = mocker.patch("covalent_awslambda_plugin.awslambda.open")
-    pickle_load_mock = mocker.patch("covalent_awslambda_plugin.awslambda.pickle.load")
+async def test_run_error_handling(lambda_executor, task_ids, mocker):
     upload_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._upload_task"
     )
-    payload_mock = MagicMock()
+    payload_mock = Mock()
     function_response = {"StatusCode": 200, "FunctionError": "Unhandled", "Payload": payload_mock}
 
     submit_mock = mocker.patch(
@@ -275,21 +648,14 @@ async def test_run_error_handling(lambda_executor, mocker):
 
     poll_mock = mocker.patch("covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._poll_task")
     query_mock = mocker.patch("covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.query_result")
-    function = None
-    args = []
-    kwargs = {}
-    dispatch_id = "asdf"
-    node_id = 0
-    task_metadata = {"dispatch_id": dispatch_id, "node_id": node_id}
+    with pytest.raises(RuntimeError):
+        await lambda_executor.run(None, [], {}, task_ids.task_metadata)
 
-    with pytest.raises(RuntimeError) as ex:
-        await lambda_executor.run(function, args, kwargs, task_metadata)
-        payload_mock.read.assert_called()
-        poll_mock.assert_not_awaited()
-        query_mock.assert_not_awaited()
+    payload_mock.read.assert_called()
+    poll_mock.assert_not_awaited()
+    query_mock.assert_not_awaited()
 
 
-@pytest.mark.asyncio
 async def test_get_status(lambda_executor, mocker):
     session_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
@@ -298,22 +664,19 @@ async def test_get_status(lambda_executor, mocker):
 
     result_filename = "test_file"
 
-    session_client_mock = session_mock.return_value.__enter__.return_value.client
-    s3_client_head_object_mock = (
-        session_mock.return_value.__enter__.return_value.client.return_value.head_object
-    )
+    session_client_mock = _session_client(session_mock)
+    s3_client_head_object_mock = session_client_mock.return_value.head_object
     mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
 
     key_exists = await lambda_executor.get_status(result_filename)
 
-    session_client_mock.assert_called_with("s3")
+    session_client_mock.assert_called_with("s3", config=awslambda.BOTO_CLIENT_CONFIG)
     s3_client_head_object_mock.assert_called_with(
         Bucket=lambda_executor.s3_bucket_name, Key=result_filename
     )
     assert key_exists
 
 
-@pytest.mark.asyncio
 async def test_get_status_else_path(lambda_executor, mocker):
     session_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
@@ -322,22 +685,41 @@ async def test_get_status_else_path(lambda_executor, mocker):
 
     result_filename = "test_file"
 
-    session_client_mock = session_mock.return_value.__enter__.return_value.client
-    s3_client_head_object_mock = (
-        session_mock.return_value.__enter__.return_value.client.return_value.head_object
+    session_client_mock = _session_client(session_mock)
+    s3_client_head_object_mock = session_client_mock.return_value.head_object
+    s3_client_head_object_mock.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
     )
-    s3_client_head_object_mock.side_effect = botocore.exceptions.ClientError({}, "head_object")
 
     return_value = await lambda_executor.get_status(result_filename)
 
-    session_client_mock.assert_called_with("s3")
+    session_client_mock.assert_called_with("s3", config=awslambda.BOTO_CLIENT_CONFIG)
     s3_client_head_object_mock.assert_called_with(
         Bucket=lambda_executor.s3_bucket_name, Key=result_filename
     )
     assert not return_value
 
 
-@pytest.mark.asyncio
+async def test_get_status_forbidden(lambda_executor, mocker):
+    """Test that a 403 is treated as not yet uploaded and reported once per bucket."""
+    session_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    app_log_mock = mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
+    _session_client(
+        session_mock
+    ).return_value.head_object.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "403", "Message": "Forbidden"}}, "HeadObject"
+    )
+
+    assert not await lambda_executor.get_status("result.pkl")
+    assert not await lambda_executor.get_status("exception.json")
+
+    app_log_mock.warning.assert_called_once()
+    app_log_mock.exception.assert_not_called()
+
+
 async def test_get_status_exception_path(lambda_executor, mocker):
     session_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
@@ -346,128 +728,109 @@ async def test_get_status_exception_path(lambda_executor, mocker):
 
     result_filename = "test_file"
 
-    session_client_mock = session_mock.return_value.__enter__.return_value.client
+    session_client_mock = _session_client(session_mock)
     app_log_mock = mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
 
-    s3_client_head_object_mock = (
-        session_mock.return_value.__enter__.return_value.client.return_value.head_object
-    )
-    s3_client_head_object_mock.side_effect = botocore.exceptions.ClientError({}, "head_object")
+    s3_client_head_object_mock = session_client_mock.return_value.head_object
+    s3_client_head_object_mock.side_effect = _CLIENT_ERROR
 
-    return_value = await lambda_executor.get_status(result_filename)
+    with pytest.raises(botocore.exceptions.ClientError):
+        await lambda_executor.get_status(result_filename)
 
-    session_client_mock.assert_called_with("s3")
+    session_client_mock.assert_called_with("s3", config=awslambda.BOTO_CLIENT_CONFIG)
     s3_client_head_object_mock.assert_called_with(
         Bucket=lambda_executor.s3_bucket_name, Key=result_filename
     )
+    app_log_mock.exception.assert_called_once_with(_CLIENT_ERROR)
 
 
-@pytest.mark.asyncio
-async def test_query_result(lambda_executor, mocker):
+async def test_query_result(lambda_executor, patched_awslambda, mocker):
     result_filename = "test_file"
-    workdir = "test_dir"
-    lambda_executor._key_exists = True
 
     session_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
         return_value=MagicMock(),
     )
-    session_client_mock = session_mock.return_value.__enter__.return_value.client
-    s3_client_mock = session_client_mock.return_value.download_file
-    open_mock = mocker.patch("covalent_awslambda_plugin.awslambda.open")
-    pickle_load_mock = mocker.patch("covalent_awslambda_plugin.awslambda.pickle.load")
-
-    lambda_executor.get_status = AsyncMock(return_value=True)
+    session_client_mock = _session_client(session_mock)
+    get_object_mock = session_client_mock.return_value.get_object
+    body_mock = get_object_mock.return_value["Body"]
+    open_mock = patched_awslambda.open
+    pickle_load_mock = patched_awslambda.pickle_load
 
-    await lambda_executor.query_result(workdir, result_filename)
+    result = await lambda_executor.query_result(result_filename)
 
-    session_client_mock.assert_called_once_with("s3")
-    s3_client_mock.assert_called_once_with(
-        lambda_executor.s3_bucket_name, result_filename, os.path.join(workdir, result_filename)
+    session_client_mock.assert_called_once_with("s3", config=awslambda.BOTO_CLIENT_CONFIG)
+    get_object_mock.assert_called_once_with(
+        Bucket=lambda_executor.s3_bucket_name, Key=result_filename
     )
-    open_mock.assert_called_once_with(os.path.join(workdir, result_filename), "rb")
-    pickle_load_mock.assert_called_once_with(open_mock.return_value.__enter__.return_value)
+    pickle_load_mock.assert_called_once_with(body_mock.__enter__.return_value)
+    body_mock.__exit__.assert_called_once()
+    open_mock.assert_not_called()
+    assert result is pickle_load_mock.return_value
 
 
-@pytest.mark.asyncio
-async def test_query_result_exception(lambda_executor, mocker):
+async def test_query_result_exception(lambda_executor, patched_awslambda, mocker):
     result_filename = "test_file"
-    workdir = "test_dir"
-    lambda_executor._key_exists = True
 
     session_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
         return_value=MagicMock(),
     )
 
-    session_client_mock = session_mock.return_value.__enter__.return_value.client
-    s3_client_mock = session_client_mock.return_value.download_file
-    client_error_mock = botocore.exceptions.ClientError(MagicMock(), MagicMock())
-    s3_client_mock.side_effect = client_error_mock
+    session_client_mock = _session_client(session_mock)
+    get_object_mock = session_client_mock.return_value.get_object
+    client_error_mock = _CLIENT_ERROR
+    get_object_mock.side_effect = client_error_mock
 
-    open_mock = mocker.patch("covalent_awslambda_plugin.awslambda.open")
-    pickle_load_mock = mocker.patch("covalent_awslambda_plugin.awslambda.pickle.load")
-    app_log_mock = mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
+    pickle_load_mock = patched_awslambda.pickle_load
+    app_log_mock = patched_awslambda.app_log
 
     with pytest.raises(botocore.exceptions.ClientError):
-        await lambda_executor.query_result(workdir, result_filename)
-
-        session_client_mock.assert_called_once_with("s3")
+        await lambda_executor.query_result(result_filename)
 
-        s3_client_mock.assert_called_once_with(
-            lambda_executor.s3_bucket_name, result_filename, os.path.join(workdir, result_filename)
-        )
+    session_client_mock.assert_called_once_with("s3", config=awslambda.BOTO_CLIENT_CONFIG)
+    get_object_mock.assert_called_once_with(
+        Bucket=lambda_executor.s3_bucket_name, Key=result_filename
+    )
 
-        app_log_mock.exception.assert_called_once_with(client_error_mock)
-        open_mock.assert_called_once_with(os.path.join(workdir, result_filename), "rb")
-        pickle_load_mock.assert_called_once_with(open_mock.return_value.__enter__.return_value)
+    app_log_mock.exception.assert_called_once_with(client_error_mock)
+    pickle_load_mock.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_run_async_subprocess(lambda_executor):
+async def test_run_async_subprocess(lambda_executor, tmp_path):
     """Test awslambda executor async subprocess call"""
 
-    test_dir, test_file, non_existent_file = "file_dir", "file.txt", "non_existent_file.txt"
+    test_dir, test_file, non_existent_file = (
+        tmp_path / "file_dir",
+        "file.txt",
+        "non_existent_file.txt",
+    )
     create_file = (
-        f"rm -rf {test_dir} && mkdir {test_dir} && cd {test_dir} && touch {test_file} && echo 'hello remote "
-        f"executor' >> {test_file} "
+        f"mkdir -p {test_dir} && printf 'hello remote executor\\n' > {test_dir}/{test_file}"
     )
     read_non_existent_file = f"cat {non_existent_file}"
 
-    (
-        create_file_proc,
-        create_file_stdout,
-        create_file_stderr,
-    ) = await AWSLambdaExecutor.run_async_subprocess(create_file)
+    # The two commands touch disjoint paths so they can run concurrently
+    create_file_res, read_file_res = await asyncio.gather(
+        AWSLambdaExecutor.run_async_subprocess(create_file),
+        AWSLambdaExecutor.run_async_subprocess(read_non_existent_file),
+    )
+    create_file_proc, create_file_stdout, create_file_stderr = create_file_res
+    read_file_proc, read_file_stdout, read_file_stderr = read_file_res
 
     # Test that file creation works as expected
     assert create_file_proc.returncode == 0
-    assert create_file_stdout.decode() == ""
-    assert create_file_stderr.decode() == ""
-
-    # Test that file was created and written to correctly
-    try:
-        with open(f"{test_dir}/{test_file}", "r") as test_file:
-            lines = test_file.readlines()
-            assert lines[0].strip() == "hello remote executor"
+    assert create_file_stdout == b""
+    assert create_file_stderr == b""
 
-    except FileNotFoundError as fe:
-        pytest.fail(f'Failed to parse {test_file} with exception "{fe}"')
+    # Test that the file was created
+    assert (test_dir / test_file).exists()
 
     # Test that reading from a non-existent file throws an error and returns a non-zero exit code
-    (
-        read_file_proc,
-        read_file_stdout,
-        read_file_stderr,
-    ) = await AWSLambdaExecutor.run_async_subprocess(read_non_existent_file)
-
     assert read_file_proc.returncode == 1
-    assert (
-        read_file_stderr.decode().strip() == f"cat: {non_existent_file}: No such file or directory"
-    )
+    assert read_file_stderr.decode().strip() == _CAT_MISSING
 
 
-@pytest.mark.asyncio
 async def test_poll_task(lambda_executor, mocker):
     lambda_executor.timeout = 5
     object_key = "test"
@@ -479,7 +842,6 @@ async def test_poll_task(lambda_executor, mocker):
     assert key == object_key
 
 
-@pytest.mark.asyncio
 async def test_poll_task_exception_path(lambda_executor, mocker):
     lambda_executor.timeout = 5
     get_status_mock = mocker.patch(
@@ -490,64 +852,67 @@ async def test_poll_task_exception_path(lambda_executor, mocker):
     with pytest.raises(TimeoutError):
         await lambda_executor._poll_task(["test"])
 
-    get_status_mock.assert_called_once()
-    asyncio_sleep_mock.assert_awaited_once()
-
+    delays = [c.args[0] for c in asyncio_sleep_mock.await_args_list]
+    assert delays[0] == awslambda.MIN_POLL_INTERVAL
+    assert delays == sorted(delays)
+    assert max(delays) <= lambda_executor.poll_freq
+    assert sum(delays) == pytest.approx(lambda_executor.timeout)
+    assert get_status_mock.call_count == len(delays) + 1
 
-@pytest.mark.asyncio
-async def test_raise_task_exception(lambda_executor, mocker):
-    task_metadata = {"dispatch_id": "abcd", "node_id": 0}
-    function = None
-    args = []
-    kwargs = {}
 
-    exception_filename = (
-        f"exception-{task_metadata['dispatch_id']}-{task_metadata['node_id']}.json"
+async def test_poll_task_backoff_cap(lambda_executor, mocker):
+    lambda_executor.timeout = 10
+    lambda_executor.poll_freq = 1
+    result_key, exception_key = "result", "exception"
+    get_status_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_status", return_value=False
     )
-    mocker.patch("covalent_awslambda_plugin.awslambda.open")
+    asyncio_sleep_mock = mocker.patch("covalent_awslambda_plugin.awslambda.asyncio.sleep")
+
+    with pytest.raises(TimeoutError):
+        await lambda_executor._poll_task([result_key, exception_key])
+
+    delays = [c.args[0] for c in asyncio_sleep_mock.await_args_list]
+    assert max(delays) == lambda_executor.poll_freq
+    assert sum(delays) == pytest.approx(lambda_executor.timeout)
+
+    # Every poll checks both keys before sleeping once
+    assert get_status_mock.call_count == 2 * (len(delays) + 1)
+
+
+async def test_raise_task_exception(lambda_executor, task_ids, mocker):
     mocker.patch("covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._upload_task")
     mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.submit_task", return_value=""
     )
-    mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
     mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._poll_task",
-        return_value=exception_filename,
+        return_value=task_ids.exception_filename,
     )
     mocker.patch("covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.query_task_exception")
 
     with pytest.raises(RuntimeError):
-        await lambda_executor.run(function, args, kwargs, task_metadata)
+        await lambda_executor.run(None, [], {}, task_ids.task_metadata)
 
 
-@pytest.mark.asyncio
-async def test_return_result_object(lambda_executor, mocker):
-    task_metadata = {"dispatch_id": "abcd", "node_id": 0}
-    function = None
-    args = []
-    kwargs = {}
-
-    result_filename = f"result-{task_metadata['dispatch_id']}-{task_metadata['node_id']}.pkl"
-    mocker.patch("covalent_awslambda_plugin.awslambda.open")
+async def test_return_result_object(lambda_executor, task_ids, mocker):
     mocker.patch("covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._upload_task")
     mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.submit_task", return_value=""
     )
-    mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
     mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor._poll_task",
-        return_value=result_filename,
+        return_value=task_ids.result_filename,
     )
     query_result_mock = mocker.patch(
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.query_result", return_value="object"
     )
 
-    await lambda_executor.run(function, args, kwargs, task_metadata)
+    await lambda_executor.run(None, [], {}, task_ids.task_metadata)
 
     query_result_mock.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_query_task_execption(lambda_executor, mocker):
     exception_filename = "test_exepction_file"
     workdir = "test_dir"
@@ -556,7 +921,7 @@ async def test_query_task_execption(lambda_executor, mocker):
         "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
         return_value=MagicMock(),
     )
-    session_client_mock = session_mock.return_value.__enter__.return_value.client
+    session_client_mock = _session_client(session_mock)
     s3_client_mock = session_client_mock.return_value.download_file
     open_mock = mocker.patch("covalent_awslambda_plugin.awslambda.open")
     json_load_mock = mocker.patch("covalent_awslambda_plugin.awslambda.json.load")
@@ -565,17 +930,17 @@ async def test_query_task_execption(lambda_executor, mocker):
 
     await lambda_executor.query_task_exception(workdir, exception_filename)
 
-    session_client_mock.assert_called_once_with("s3")
+    session_client_mock.assert_called_once_with("s3", config=awslambda.BOTO_CLIENT_CONFIG)
     s3_client_mock.assert_called_once_with(
         lambda_executor.s3_bucket_name,
         exception_filename,
         os.path.join(workdir, exception_filename),
+        Config=awslambda.TRANSFER_CONFIG,
     )
     open_mock.assert_called_once_with(os.path.join(workdir, exception_filename), "r")
     json_load_mock.assert_called_once_with(open_mock.return_value.__enter__.return_value)
 
 
-@pytest.mark.asyncio
 async def test_query_task_exception_exception_path(lambda_executor, mocker):
     exception_filename = "test_file"
     workdir = "test_dir"
@@ -586,9 +951,9 @@ async def test_query_task_exception_exception_path(lambda_executor, mocker):
         return_value=MagicMock(),
     )
 
-    session_client_mock = session_mock.return_value.__enter__.return_value.client
+    session_client_mock = _session_client(session_mock)
     s3_client_mock = session_client_mock.return_value.download_file
-    client_error_mock = botocore.exceptions.ClientError(MagicMock(), MagicMock())
+    client_error_mock = _CLIENT_ERROR
     s3_client_mock.side_effect = client_error_mock
 
     open_mock = mocker.patch("covalent_awslambda_plugin.awslambda.open")
@@ -598,17 +963,74 @@ async def test_query_task_exception_exception_path(lambda_executor, mocker):
     with pytest.raises(botocore.exceptions.ClientError):
         await lambda_executor.query_task_exception(workdir, exception_filename)
 
-        session_client_mock.assert_called_once_with("s3")
+    session_client_mock.assert_called_once_with("s3", config=awslambda.BOTO_CLIENT_CONFIG)
 
-        s3_client_mock.assert_called_once_with(
-            lambda_executor.s3_bucket_name,
-            exception_filename,
-            os.path.join(workdir, exception_filename),
-        )
+    s3_client_mock.assert_called_once_with(
+        lambda_executor.s3_bucket_name,
+        exception_filename,
+        os.path.join(workdir, exception_filename),
+        Config=awslambda.TRANSFER_CONFIG,
+    )
+
+    app_log_mock.exception.assert_called_once_with(client_error_mock)
+    open_mock.assert_not_called()
+    json_load_mock.assert_not_called()
+
+
+async def test_teardown(lambda_executor, task_ids, mocker):
+    session_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    delete_objects_mock = _session_client(session_mock).return_value.delete_objects
+    delete_objects_mock.return_value = {}
+
+    await lambda_executor.teardown(task_ids.task_metadata)
+
+    delete_objects_mock.assert_called_once()
+    kwargs = delete_objects_mock.call_args.kwargs
+    assert kwargs["Bucket"] == lambda_executor.s3_bucket_name
+    assert kwargs["Delete"]["Quiet"]
+    assert {obj["Key"] for obj in kwargs["Delete"]["Objects"]} == {
+        task_ids.func_filename,
+        task_ids.result_filename,
+        task_ids.exception_filename,
+    }
+
+
+@pytest.mark.parametrize(
+    "error",
+    [_CLIENT_ERROR, botocore.exceptions.EndpointConnectionError(endpoint_url="https://s3")],
+)
+async def test_teardown_exception(lambda_executor, task_ids, mocker, error):
+    session_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    app_log_mock = mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
+    delete_objects_mock = _session_client(session_mock).return_value.delete_objects
+    delete_objects_mock.side_effect = error
+
+    await lambda_executor.teardown(task_ids.task_metadata)
+
+    delete_objects_mock.assert_called_once()
+    app_log_mock.exception.assert_called_once_with(error)
+
+
+def test_teardown_partial_failure(lambda_executor, task_ids, mocker):
+    session_mock = mocker.patch(
+        "covalent_awslambda_plugin.awslambda.AWSLambdaExecutor.get_session",
+        return_value=MagicMock(),
+    )
+    app_log_mock = mocker.patch("covalent_awslambda_plugin.awslambda.app_log")
+    _session_client(session_mock).return_value.delete_objects.return_value = {
+        "Errors": [{"Key": task_ids.func_filename, "Message": "Access Denied"}]
+    }
+
+    lambda_executor._teardown_sync([task_ids.func_filename])
 
-        app_log_mock.exception.assert_called_once_with(client_error_mock)
-        open_mock.assert_called_once_with(os.path.join(workdir, exception_filename), "r")
-        json_load_mock.assert_called_once_with(open_mock.return_value.__enter__.return_value)
+    app_log_mock.warning.assert_called_once()
+    assert task_ids.func_filename in app_log_mock.warning.call_args.args[0]
 
 
 def test_pickle_func_sync(lambda_executor):
@@ -617,16 +1039,14 @@ def test_pickle_func_sync(lambda_executor):
     def test_func(x):
         return x
 
-    lambda_executor._pickle_func_sync(test_func, "/tmp", "test.pkl", [1], {"x": 1})
-    with open("/tmp/test.pkl", "rb") as f:
-        func, args, kwargs = pickle.load(f)
+    func_buffer = lambda_executor._pickle_func_sync(test_func, [1], {"x": 1})
+    func, args, kwargs = pickle.load(func_buffer)
 
     assert func(1) == 1
     assert args == [1]
     assert kwargs == {"x": 1}
 
 
-@pytest.mark.asyncio
 async def test_pickle_func(lambda_executor, mocker):
     """Test the asynchronous function pickling method."""
     pickle_func_sync_mock = mocker.patch(
@@ -636,5 +1056,6 @@ async def test_pickle_func(lambda_executor, mocker):
     def test_func(x):
         return x
 
-    await lambda_executor._pickle_func(test_func, "/tmp", "test.pkl", [1], {"x": 1})
-    pickle_func_sync_mock.assert_called_once_with(test_func, "/tmp", "test.pkl", [1], {"x": 1})
+    func_buffer = await lambda_executor._pickle_func(test_func, [1], {"x": 1})
+    pickle_func_sync_mock.assert_called_once_with(test_func, [1], {"x": 1})
+    assert func_buffer is pickle_func_sync_mock.return_value
@@ -14,16 +14,45 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
-from pickle import PickleError
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
-from covalent_awslambda_plugin.exec import handler
+from covalent_awslambda_plugin.exec import FILE_BUFFER_SIZE, TRANSFER_CONFIG, _s3_client, handler
 
+# Methods of the S3 client used by the handler, anything else is a test error
+_S3_CLIENT_SPEC = ["download_file", "put_object", "upload_file", "upload_fileobj"]
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
+def clear_s3_client():
+    """Drop the S3 client cached by previous tests"""
+    _s3_client.cache_clear()
+    yield
+    _s3_client.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def patched_exec(mocker):
+    """Patch the file system, S3 and pickling used by the handler"""
+    return SimpleNamespace(
+        os_environ=mocker.patch("covalent_awslambda_plugin.exec.os.environ"),
+        os_chdir=mocker.patch("covalent_awslambda_plugin.exec.os.chdir"),
+        boto3_client=mocker.patch(
+            "covalent_awslambda_plugin.exec.boto3.client",
+            return_value=Mock(spec=_S3_CLIENT_SPEC),
+        ),
+        open=mocker.patch("covalent_awslambda_plugin.exec.open"),
+        pickle_load=mocker.patch(
+            "covalent_awslambda_plugin.exec.pickle.load",
+            return_value=(Mock(), [], {}),
+        ),
+        pickle_dumps=mocker.patch("covalent_awslambda_plugin.exec.pickle.dumps"),
+    )
+
+
+@pytest.fixture(scope="module")
 def event():
     return {
         "S3_BUCKET_NAME": "test",
@@ -33,54 +62,21 @@ def event():
     }
 
 
-def test_assert_os_environ_home(mocker, event):
-    os_environ_mock = mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    mocker.patch("covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock())
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
-
+def test_assert_os_environ_home(patched_exec, event):
     # invoke the handler
     handler(event, None)
 
-    os_environ_mock.__setitem__.assert_called_with("HOME", "/tmp")
-
+    patched_exec.os_environ.__setitem__.assert_called_with("HOME", "/tmp")
 
-def test_assert_os_chdir_tmp(mocker, event):
-    os_chdir_mock = mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    mocker.patch("covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock())
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
 
+def test_assert_os_chdir_tmp(patched_exec, event):
     # invoke the handler
     handler(event, None)
 
-    os_chdir_mock.assert_called_with("/tmp")
-
+    patched_exec.os_chdir.assert_called_with("/tmp")
 
-def test_assert_s3_bucket_name_exception(mocker, event):
-    mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    mocker.patch("covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock())
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
 
+def test_assert_s3_bucket_name_exception(event):
     with pytest.raises(Exception) as r:
         handler(
             {
@@ -92,18 +88,7 @@ def test_assert_s3_bucket_name_exception(mocker, event):
         )
 
 
-def test_assert_covalent_task_filename_exception(mocker, event):
-    mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    mocker.patch("covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock())
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
-
+def test_assert_covalent_task_filename_exception(event):
     with pytest.raises(Exception) as r:
         handler(
             {
@@ -115,18 +100,7 @@ def test_assert_covalent_task_filename_exception(mocker, event):
         )
 
 
-def test_assert_result_filename_exception(mocker, event):
-    mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    mocker.patch("covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock())
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
-
+def test_assert_result_filename_exception(event):
     with pytest.raises(Exception) as r:
         handler(
             {
@@ -138,18 +112,7 @@ def test_assert_result_filename_exception(mocker, event):
         )
 
 
-def test_assert_exception_filename_exception(mocker, event):
-    mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    mocker.patch("covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock())
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
-
+def test_assert_exception_filename_exception(event):
     with pytest.raises(Exception) as r:
         handler(
             {
@@ -161,136 +124,113 @@ def test_assert_exception_filename_exception(mocker, event):
         )
 
 
-def test_assert_os_path_join(mocker, event):
-    mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    os_path_join_mock = mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    mocker.patch("covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock())
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
-
+def test_assert_tmp_paths(patched_exec, event):
     # invoke the handler
     handler(event, None)
 
-    assert os_path_join_mock.call_count == 3
-
-
-def test_assert_boto3_client(mocker, event):
-    mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    boto3_client_mock = mocker.patch(
-        "covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock()
+    s3_client_mock = patched_exec.boto3_client.return_value
+    s3_client_mock.download_file.assert_called_once_with(
+        "test", "test_function.pkl", "/tmp/test_function.pkl", Config=TRANSFER_CONFIG
     )
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
+    s3_client_mock.put_object.assert_called_once_with(
+        Bucket="test", Key="test_result.pkl", Body=patched_exec.pickle_dumps.return_value
     )
-    mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
 
+
+def test_assert_boto3_client(patched_exec, event):
     # invoke the handler
     handler(event, None)
 
-    boto3_client_mock.assert_called_with("s3")
+    patched_exec.boto3_client.assert_called_with("s3")
 
 
-def test_assert_s3_download_file_mock(mocker, event):
-    mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    boto3_client_mock = mocker.patch(
-        "covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock()
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
+def test_s3_client_reused(patched_exec, event):
+    # invoke the handler twice in the same (warm) container
+    handler(event, None)
+    handler(event, None)
 
+    patched_exec.boto3_client.assert_called_once_with("s3")
+    assert patched_exec.boto3_client.return_value.download_file.call_count == 2
+
+
+def test_assert_s3_download_file_mock(patched_exec, event):
     # invoke the handler
     handler(event, None)
 
-    boto3_client_mock.return_value.download_file.assert_called_once()
+    download_file_mock = patched_exec.boto3_client.return_value.download_file
+    download_file_mock.assert_called_once()
+    assert download_file_mock.call_args.kwargs["Config"] is TRANSFER_CONFIG
 
 
-def test_assert_pickle_load_mock(mocker, event):
-    mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    mocker.patch("covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock())
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    pickle_load_mock = mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
+def test_assert_pickle_load_mock(patched_exec, event):
+    # invoke the handler
+    handler(event, None)
+
+    patched_exec.pickle_load.assert_called_once()
 
+
+def test_assert_function_call(patched_exec, event):
     # invoke the handler
     handler(event, None)
 
-    pickle_load_mock.assert_called_once()
+    function, args, kwargs = patched_exec.pickle_load.return_value
 
+    function.assert_called_once_with(*args, **kwargs)
 
-def test_assert_function_call(mocker, event):
-    mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    mocker.patch("covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock())
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    pickle_load_mock = mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
 
+def test_assert_pickle_dump(patched_exec, event):
     # invoke the handler
     handler(event, None)
 
-    args = pickle_load_mock.return_value[1]
-    kwargs = pickle_load_mock.return_value[2]
+    function, args, kwargs = patched_exec.pickle_load.return_value
+    patched_exec.pickle_dumps.assert_called_once_with(function.return_value, protocol=5)
 
-    pickle_load_mock.return_value[0].assert_called_once_with(*args, **kwargs)
 
+def test_assert_open_buffering(patched_exec, event):
+    # invoke the handler
+    handler(event, None)
 
-def test_assert_pickle_dump(mocker, event):
-    mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    mocker.patch("covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock())
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
+    patched_exec.open.assert_called_once_with(
+        "/tmp/test_function.pkl", "rb", buffering=FILE_BUFFER_SIZE
     )
-    pickle_dump_mock = mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
 
+
+def test_assert_s3_upload_result_file(patched_exec, event):
     # invoke the handler
     handler(event, None)
 
-    pickle_dump_mock.assert_called_once()
+    s3_client_mock = patched_exec.boto3_client.return_value
+    s3_client_mock.put_object.assert_called_once()
+    s3_client_mock.upload_file.assert_not_called()
+    patched_exec.open.assert_called_once()
 
 
-def test_assert_s3_upload_result_file(mocker, event):
-    mocker.patch("covalent_awslambda_plugin.exec.os.chdir")
-    mocker.patch("covalent_awslambda_plugin.exec.os.environ")
-    mocker.patch("covalent_awslambda_plugin.exec.os.path.join")
-    s3_client_mock = mocker.patch(
-        "covalent_awslambda_plugin.exec.boto3.client", return_value=MagicMock()
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.open")
-    mocker.patch(
-        "covalent_awslambda_plugin.exec.pickle.load",
-        return_value=(MagicMock(), MagicMock(), MagicMock()),
-    )
-    mocker.patch("covalent_awslambda_plugin.exec.pickle.dump")
+def test_assert_s3_upload_large_result(patched_exec, event):
+    patched_exec.pickle_dumps.return_value = b"0" * TRANSFER_CONFIG.multipart_threshold
 
     # invoke the handler
     handler(event, None)
 
-    s3_client_mock.return_value.upload_file.assert_called_once()
+    s3_client_mock = patched_exec.boto3_client.return_value
+    s3_client_mock.put_object.assert_not_called()
+    s3_client_mock.upload_fileobj.assert_called_once()
+    fileobj, bucket, key = s3_client_mock.upload_fileobj.call_args.args
+    assert fileobj.getvalue() == patched_exec.pickle_dumps.return_value
+    assert (bucket, key) == ("test", "test_result.pkl")
+    assert s3_client_mock.upload_fileobj.call_args.kwargs["Config"] is TRANSFER_CONFIG
+
+
+def test_handler_returns_object_key(patched_exec, event):
+    assert handler(event, None) == {"object_key": event["RESULT_FILENAME"]}
+
+    # result upload fails, exception upload succeeds
+    s3_client_mock = patched_exec.boto3_client.return_value
+    s3_client_mock.put_object.side_effect = Exception("upload failed")
+    assert handler(event, None) == {"object_key": event["EXCEPTION_FILENAME"]}
+
+
+def test_keep_warm_ping(patched_exec):
+    # invoke the handler
+    handler({"__warm__": True}, None)
+
+    patched_exec.boto3_client.assert_not_called()